@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 # dependencies = [
 #   "selenium>=4.10.0",
-#   "dateparser",
 #   "tzdata",
 #   "requests"
 # ]
@@ -12,18 +11,87 @@ import logging
 import argparse
 import platform
 import os
+import mmap
+import sys
+import re
+import shutil
+import socket
+import subprocess
+try:
+    import fcntl
+except ImportError: # Windows: no profile locking, every session gets a temp profile
+    fcntl = None
+import json
 import stat
+import hashlib
 import tarfile
 import tempfile
+import queue
+import threading
+import xml.etree.ElementTree as ET
 import requests
-from datetime import datetime, timedelta
-import dateparser
+from requests.adapters import HTTPAdapter
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs
 from selenium import webdriver
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+GECKODRIVER_AARCH64_URL = "https://github.com/mozilla/geckodriver/releases/download/v0.36.0/geckodriver-v0.36.0-linux-aarch64.tar.gz"
+GECKODRIVER_LINUX64_URL = "https://github.com/mozilla/geckodriver/releases/download/v0.36.0/geckodriver-v0.36.0-linux64.tar.gz"
+# `sha256sum geckodriver` of the binary inside each official release tarball.
+# A binary the script downloads and runs must match its pin; an unpinned (None) url is never
+# downloaded, and Selenium Manager provides geckodriver instead.
+GECKODRIVER_SHA256 = {
+    GECKODRIVER_AARCH64_URL: None,
+    GECKODRIVER_LINUX64_URL: None,
+}
+PROFILE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "ytchk")
+DAEMON_PROFILE = os.path.join(PROFILE_ROOT, "daemon")
+DAEMON_PID = os.path.join(tempfile.gettempdir(), "ytchk.pid")
+MARIONETTE_PORT = 2828
+PAGE_LOAD_TIMEOUT = 5
+SCRIPT_TIMEOUT = 20
+HTTP_WORKERS = 50
+MAX_BROWSERS = 4
+# Nothing on the page is rendered for a human: skip images, ads/trackers, autoplay and WebRTC
+FIREFOX_PREFS = {
+    "permissions.default.image": 2,
+    "browser.contentblocking.category": "strict",
+    "media.autoplay.default": 5,
+    "media.peerconnection.enabled": False,
+    # The profiles persist, so YouTube's static assets stay cached between runs
+    "browser.cache.disk.enable": True,
+    "browser.cache.disk.capacity": 256000,
+}
+CONSENT_COOKIES = {"SOCS": "CAI", "CONSENT": "YES+"}
+INNERTUBE_URL = "https://www.youtube.com/youtubei/v1/{}?prettyPrint=false"
+# hl=en keeps publishedTimeText in the English form parse_yt_relative understands
+INNERTUBE_CONTEXT = {"client": {"clientName": "WEB", "clientVersion": "2.20240101.00.00", "hl": "en", "gl": "US"}}
+INNERTUBE_VIDEOS_TAB = "EgZ2aWRlb3PyBgQKAjoA"
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+FEED_NS = {"atom": "http://www.w3.org/2005/Atom"}
+CHANNEL_ID_CACHE = os.path.join(tempfile.gettempdir(), "ytchk_channel_ids.json")
+_REL_RE = re.compile(r"(?:streamed\s+|premiered\s+)?(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago")
+_ONE_HOUR = timedelta(hours=1)
+_REL_UNITS = {"second": timedelta(seconds=1), "minute": timedelta(minutes=1), "hour": _ONE_HOUR}
+_OLD_UNITS = (" day", " week", " month", " year")
+# Waits until the watch page for arguments[0] is the one in the DOM, so a page left over from
+# a timed-out navigation (or the pooled session's previous video) is never read
+_VIDEO_DETAILS_JS = """
+const [videoId, done] = arguments;
+const poll = () => {
+    const page = document.querySelector('ytd-watch-flexy');
+    const u = page && page.querySelector('ytd-channel-name #text');
+    const d = page && page.querySelector('#description-inline-expander');
+    if (page && page.getAttribute('video-id') === videoId && u && d && d.innerText) done([u.innerText, d.innerText]);
+    else setTimeout(poll, 50);
+};
+poll();
+"""
 
 def setup_logging(verbose=False):
     """Configures logging to write to output.log if verbose is True."""
@@ -32,6 +100,27 @@ def setup_logging(verbose=False):
     else:
         logging.basicConfig(level=logging.CRITICAL, format='%(message)s')
 
+def read_text(path):
+    """Returns the stripped contents of a small text file, or None if it can't be read."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_text(path, text):
+    """Overwrites a small text file with the given contents."""
+    with open(path, "w") as f:
+        f.write(text)
+
+def file_sha256(path):
+    """Returns the hex SHA256 digest of a file, read in 64KB chunks."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
 def get_geckodriver_path():
     """
     Downloads and returns the path to the geckodriver executable.
@@ -41,86 +130,454 @@ def get_geckodriver_path():
     arch = platform.machine().lower()
 
     if "linux" in system and "aarch64" in arch:
-        gecko_url = "https://github.com/mozilla/geckodriver/releases/download/v0.36.0/geckodriver-v0.36.0-linux-aarch64.tar.gz"
+        gecko_url = GECKODRIVER_AARCH64_URL
     elif "linux" in system and "x86_64" in arch:
-        gecko_url = "https://github.com/mozilla/geckodriver/releases/download/v0.36.0/geckodriver-v0.36.0-linux64.tar.gz"
+        gecko_url = GECKODRIVER_LINUX64_URL
     else:
         # Add more architectures here if needed
         return None # Let selenium manager handle it
 
+    expected_sha256 = GECKODRIVER_SHA256.get(gecko_url)
+    if not expected_sha256:
+        logging.warning(f"No pinned SHA256 for {gecko_url}, letting selenium manager provide geckodriver")
+        return None
+
     temp_dir = tempfile.gettempdir()
     gecko_path = os.path.join(temp_dir, "geckodriver")
 
-    if not os.path.exists(gecko_path):
-        logging.info(f"Downloading geckodriver from {gecko_url}")
-        response = requests.get(gecko_url, stream=True)
+    tarball_path = os.path.join(temp_dir, os.path.basename(gecko_url))
+    etag_path = tarball_path + ".etag"
+
+    if os.path.exists(gecko_path) and file_sha256(gecko_path) == expected_sha256:
+        return gecko_path
+
+    # identity: the tarball's own gzip layer is what tarfile should see, not a transparently decoded body
+    headers = {"Accept-Encoding": "identity"}
+    etag = read_text(etag_path)
+    if etag and os.path.exists(tarball_path):
+        headers["If-None-Match"] = etag
+
+    logging.info(f"Downloading geckodriver from {gecko_url}")
+    with requests.get(gecko_url, headers=headers, stream=True, timeout=60) as response:
         response.raise_for_status()
+        if response.status_code == 304:
+            logging.info(f"Cached {tarball_path} is up to date, re-extracting it")
+        else:
+            # Write to a uniquely named side file so an interrupted or concurrent download never
+            # sits next to a valid ETag
+            fd, part_path = tempfile.mkstemp(dir=temp_dir, prefix="geckodriver-", suffix=".tar.gz.part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(1 << 20):
+                        f.write(chunk)
+                os.replace(part_path, tarball_path)
+            except BaseException:
+                os.remove(part_path)
+                raise
+            if response.headers.get("ETag"):
+                write_text(etag_path, response.headers["ETag"])
+            elif os.path.exists(etag_path):
+                os.remove(etag_path)
 
-        with tarfile.open(fileobj=response.raw, mode="r:gz") as tar:
-            tar.extractall(path=temp_dir, filter='data')
+    # Extract, verify and chmod a private copy, then rename it into place: an interrupted run never leaves a
+    # truncated binary, and an overlapping run never sees a half-written one or rewrites one that is executing
+    fd, new_path = tempfile.mkstemp(dir=temp_dir, prefix="geckodriver-")
+    try:
+        # Inflate straight from the mapped file and copy out only the binary
+        with os.fdopen(fd, "wb") as out, open(tarball_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                tarfile.open(fileobj=mm, mode="r:gz") as tar:
+            shutil.copyfileobj(tar.extractfile(tar.getmember("geckodriver")), out, length=1 << 20)
+
+        if file_sha256(new_path) != expected_sha256:
+            # Drop the cached tarball and its ETag too, so the next run can't keep getting a 304 for a bad file
+            for path in (tarball_path, etag_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise RuntimeError(f"geckodriver from {gecko_url} does not match its pinned SHA256")
 
-        st = os.stat(gecko_path)
-        os.chmod(gecko_path, st.st_mode | stat.S_IEXEC)
-        logging.info(f"Geckodriver downloaded and extracted to {gecko_path}")
+        os.chmod(new_path, os.stat(new_path).st_mode | stat.S_IEXEC)
+        os.replace(new_path, gecko_path)
+    except BaseException:
+        os.remove(new_path)
+        raise
+    logging.info(f"Geckodriver downloaded and extracted to {gecko_path}")
 
     return gecko_path
 
 
-def get_recent_video_info(driver, channel_url):
-    """Optimized function to check for recent videos.
-    Only navigates to the video page if the upload date is recent.
-    """
-    wait = WebDriverWait(driver, 20)
+def load_channel_ids():
+    """Loads the cached @handle -> channel_id mapping from disk."""
     try:
-        logging.info(f"Checking channel: {channel_url}/videos")
-        driver.get(f"{channel_url}/videos")
+        with open(CHANNEL_ID_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_channel_ids(channel_ids):
+    """Writes the @handle -> channel_id mapping back to disk."""
+    try:
+        with open(CHANNEL_ID_CACHE, "w") as f:
+            json.dump(channel_ids, f)
+    except OSError as e:
+        logging.warning(f"Could not write channel id cache {CHANNEL_ID_CACHE}: {e}")
+
+def resolve_channel_id(session, channel_url, channel_ids):
+    """Returns the UC... channel id for a channel url, asking InnerTube only on a cache miss."""
+    channel_id = channel_ids.get(channel_url)
+    if channel_id:
+        return channel_id
+
+    logging.info(f"Resolving channel id for {channel_url}")
+    response = session.post(INNERTUBE_URL.format("navigation/resolve_url"),
+                            json={"context": INNERTUBE_CONTEXT, "url": channel_url}, timeout=10)
+    response.raise_for_status()
+    channel_id = response.json().get("endpoint", {}).get("browseEndpoint", {}).get("browseId")
+    if not channel_id:
+        return None
+    channel_ids[channel_url] = channel_id
+    return channel_id
+
+def get_latest_upload(session, channel_id):
+    """Fallback used when InnerTube is unavailable: reads the newest entry of the channel's RSS feed.
+    Returns (uploader, title, published, video_url) or None if the feed is empty.
+    """
+    response = session.get(FEED_URL.format(channel_id), timeout=10)
+    response.raise_for_status()
+    entry = ET.fromstring(response.content).find("atom:entry", FEED_NS)
+    if entry is None:
+        return None
 
-        # Find the first video container on the /videos page
-        first_video_container = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ytd-rich-grid-media")))
+    uploader = entry.findtext("atom:author/atom:name", namespaces=FEED_NS)
+    title = entry.findtext("atom:title", namespaces=FEED_NS)
+    video_url = entry.find("atom:link", FEED_NS).get("href")
+    published = datetime.fromisoformat(entry.findtext("atom:published", namespaces=FEED_NS))
+    return uploader, title, published, video_url
 
-        # Extract metadata directly from the grid view
-        title_element = first_video_container.find_element(By.ID, "video-title-link")
-        title = title_element.get_attribute("title")
-        video_url = title_element.get_attribute("href")
+def parse_yt_relative(s, now):
+    """Parses YouTube's "5 minutes ago" / "Streamed 2 hours ago" strings into an upload time.
+    Returns None if the string is unparseable or the unit is a day or longer,
+    since only uploads within the last hour matter.
+    """
+    m = _REL_RE.match(s.lower().strip())
+    if not m:
+        return None
+    unit = _REL_UNITS.get(m.group(2))
+    if unit is None:
+        return None
+    return now - int(m.group(1)) * unit
+
+def video_id_from_url(video_url):
+    """Returns the id from a watch?v=... or /shorts/... url."""
+    parsed = urlparse(video_url)
+    return parse_qs(parsed.query).get("v", [parsed.path.rstrip("/").rsplit("/", 1)[-1]])[0]
+
+def get_video_details(driver, video_url):
+    """Opens the video page and returns (uploader, description).
+    Both are polled for in a single script call; the description is in the DOM without expanding it.
+    """
+    video_id = video_id_from_url(video_url)
+    try:
+        driver.get(f"https://www.youtube.com/watch?v={video_id}")
+    except TimeoutException:
+        pass # The script below waits for this video's page itself; a slow page load doesn't matter
+    deadline = time.monotonic() + SCRIPT_TIMEOUT
+    shortened = False
+    try:
+        while True:
+            try:
+                uploader, description = driver.execute_async_script(_VIDEO_DETAILS_JS, video_id)
+                return uploader, description
+            except JavascriptException as e:
+                # Only an unload (the still-loading navigation replacing the page the script ran in) is
+                # retried, and only within what is left of the original timeout
+                remaining = deadline - time.monotonic()
+                if "Document was unloaded" not in (e.msg or "") or remaining <= 0:
+                    raise
+                driver.set_script_timeout(remaining)
+                shortened = True
+    finally:
+        if shortened:
+            driver.set_script_timeout(SCRIPT_TIMEOUT) # Pooled sessions are reused for other videos
 
-        # Metadata line contains views and date
-        metadata_line = first_video_container.find_element(By.ID, "metadata-line").find_elements(By.TAG_NAME, "span")
-        date_str = metadata_line[1].text # The date is typically the second span
+def get_browse_upload(session, channel_id):
+    """Asks InnerTube's browse endpoint for the channel's Videos tab, as youtube.com itself does.
+    Returns (uploader, title, date_str, video_url) for the newest upload, or None if none is listed.
+    """
+    response = session.post(INNERTUBE_URL.format("browse"), timeout=10, json={
+        "context": INNERTUBE_CONTEXT,
+        "browseId": channel_id,
+        "params": INNERTUBE_VIDEOS_TAB,
+    })
+    response.raise_for_status()
+    data = response.json()
+
+    uploader = data.get("metadata", {}).get("channelMetadataRenderer", {}).get("title")
+    for tab in data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]:
+        grid = tab.get("tabRenderer", {}).get("content", {}).get("richGridRenderer")
+        if not grid:
+            continue
+        for item in grid.get("contents", []):
+            video = item.get("richItemRenderer", {}).get("content", {}).get("videoRenderer")
+            if video:
+                title = video["title"]["runs"][0]["text"]
+                date_str = video.get("publishedTimeText", {}).get("simpleText", "")
+                return uploader, title, date_str, f"https://www.youtube.com/watch?v={video['videoId']}"
+    return None
 
-        # Use dateparser with a timezone-aware setting
-        upload_date = dateparser.parse(date_str, settings={'RETURN_AS_TIMEZONE_AWARE': True})
-        if not upload_date:
-            logging.warning(f"Could not parse date string '{date_str}' for {channel_url}")
+def check_recency(session, channel_url, channel_ids):
+    """Checks the channel's newest upload (via InnerTube, or the RSS feed) for one within the last hour.
+    Plain HTTP only; returns (uploader, title, date_str, video_url) for a recent upload, else None.
+    """
+    try:
+        channel_id = resolve_channel_id(session, channel_url, channel_ids)
+        if not channel_id:
+            logging.warning(f"Could not resolve channel id for {channel_url}")
             return None
 
-        # Make current time timezone-aware for comparison
-        now_aware = datetime.now(upload_date.tzinfo)
+        try:
+            latest = get_browse_upload(session, channel_id)
+        except (requests.RequestException, KeyError, ValueError) as e:
+            logging.warning(f"InnerTube lookup failed for {channel_url}: {e}")
+            latest = None
+
+        if latest is not None:
+            uploader, title, date_str, video_url = latest
+            # Most channels are rejected here with a single string scan
+            if any(unit in date_str for unit in _OLD_UNITS):
+                logging.info(f"Video for {channel_url} is older than 1 hour ({date_str}). Skipping page load.")
+                return None
+            published = parse_yt_relative(date_str, datetime.now(timezone.utc))
+            if not published:
+                logging.warning(f"Could not parse date string '{date_str}' for {channel_url}")
+                return None
+        else:
+            logging.info(f"Checking RSS feed for {channel_url}")
+            latest = get_latest_upload(session, channel_id)
+            if latest is None:
+                logging.warning(f"No uploads found for {channel_url}")
+                return None
+            uploader, title, published, video_url = latest
+            date_str = published.isoformat()
 
         # --- Conditional Navigation ---
         # Only proceed if the video is recent
-        if (now_aware - upload_date) < timedelta(hours=1):
-            logging.info(f"RECENT VIDEO FOUND: '{title}'. Navigating to page for description.")
-            driver.get(video_url)
-
-            # Now on the video page, get the uploader name and description
-            uploader = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "ytd-channel-name #text"))).text
-            wait.until(EC.element_to_be_clickable((By.ID, "expand"))).click()
-            description_container = wait.until(EC.visibility_of_element_located((By.ID, "description-inline-expander")))
-            description_text = description_container.text
-            logging.info(f'--- Video Description ---\n{description_text}')
-
-            return uploader, title, date_str, video_url
-        else:
+        if (datetime.now(published.tzinfo) - published) >= _ONE_HOUR:
             logging.info(f"Video for {channel_url} is older than 1 hour ({date_str}). Skipping page load.")
             return None
 
+        logging.info(f"RECENT VIDEO FOUND: '{title}'.")
+        return uploader, title, date_str, video_url
+
     except Exception as e:
         logging.error(f"an error occurred while processing {channel_url}: {e}\n{traceback.format_exc()}")
         return None
 
+def describe_video(pool, video_info):
+    """Loads a recent upload's page in a pooled browser and logs its description.
+    The upload is reported either way, so a failure here is only a warning.
+    """
+    video_url = video_info[3]
+    try:
+        logging.info(f"Navigating to {video_url} for description.")
+        with pool.driver() as driver:
+            _, description_text = get_video_details(driver, video_url)
+        logging.info(f'--- Video Description ---\n{description_text}')
+    except Exception as e:
+        logging.warning(f"Could not read the description of {video_url}: {e}\n{traceback.format_exc()}")
+
+def daemon_running():
+    """Returns True if the Firefox started by --daemon is still alive and listening for Marionette.
+    The port check guards against a stale pid file whose pid now belongs to another process.
+    """
+    pid = read_text(DAEMON_PID)
+    if not pid:
+        return False
+    try:
+        os.kill(int(pid), 0)
+        socket.create_connection(("127.0.0.1", MARIONETTE_PORT), timeout=1).close()
+    except (OSError, ValueError):
+        return False
+    return True
+
+def make_service(geckodriver_path, service_args=None):
+    """Builds a geckodriver Service; each browser session needs its own."""
+    if geckodriver_path:
+        return Service(executable_path=geckodriver_path, service_args=service_args)
+    return Service(service_args=service_args)
+
+def seed_consent_cookies(driver):
+    """Sets YouTube's consent cookies so the consent dialog is never shown."""
+    # add_cookie needs a page on the cookie's domain; robots.txt is the cheapest one
+    try:
+        driver.get("https://www.youtube.com/robots.txt")
+    except TimeoutException:
+        logging.warning("Timed out loading robots.txt, continuing without consent cookies")
+        return
+    # A year's expiry keeps the cookies in the persistent profiles between runs
+    expiry = int(time.time()) + 365 * 24 * 3600
+    for name, value in CONSENT_COOKIES.items():
+        driver.add_cookie({"name": name, "value": value, "domain": ".youtube.com", "path": "/",
+                           "secure": True, "expiry": expiry})
+
+def base_options():
+    """Options shared by fresh and daemon sessions.
+    The timeouts travel with the new-session request instead of costing a command per session or per page.
+    """
+    options = Options()
+    # Only the DOM is read, so don't wait for subresources to finish loading
+    options.page_load_strategy = "eager"
+    options.timeouts = {"pageLoad": PAGE_LOAD_TIMEOUT * 1000, "script": SCRIPT_TIMEOUT * 1000}
+    return options
+
+@contextmanager
+def profile_dir(slot):
+    """Yields a persistent profile directory locked for this run, trying `slot` first.
+    Firefox refuses a profile another instance is using, so when an overlapping run holds
+    every persistent profile this falls back to a throwaway temp profile.
+    """
+    if fcntl:
+        for candidate in [slot] + [i for i in range(MAX_BROWSERS) if i != slot]:
+            path = os.path.join(PROFILE_ROOT, f"ffprofile-{candidate}")
+            os.makedirs(path, exist_ok=True)
+            lock = open(os.path.join(path, "ytchk.lock"), "w")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                continue
+            try:
+                yield path
+            finally:
+                lock.close() # Releases the flock
+            return
+
+    logging.info("No persistent Firefox profile free, using a temporary one")
+    with tempfile.TemporaryDirectory(prefix="ytchk-profile-") as path:
+        yield path
+
+def start_driver(geckodriver_path, profile=None):
+    """Starts headless Firefox on the given profile directory with the consent cookies set.
+    Without a profile, attaches to the --daemon browser instead; its profile already holds the consent.
+    """
+    if profile is None:
+        logging.info(f"Attaching to daemon Firefox on marionette port {MARIONETTE_PORT}")
+        service = make_service(geckodriver_path, ["--connect-existing", "--marionette-port", str(MARIONETTE_PORT)])
+        try:
+            return webdriver.Firefox(options=base_options(), service=service)
+        except WebDriverException as e:
+            raise RuntimeError(f"Daemon Firefox on marionette port {MARIONETTE_PORT} is busy or unreachable "
+                               f"(is another run attached to it?): {e.msg}") from e
+
+    options = base_options()
+    options.add_argument("--headless")
+    options.add_argument("-profile")
+    options.add_argument(profile)
+    for name, value in FIREFOX_PREFS.items():
+        options.set_preference(name, value)
+    driver = webdriver.Firefox(options=options, service=make_service(geckodriver_path))
+    seed_consent_cookies(driver)
+    return driver
+
+@contextmanager
+def firefox_session(geckodriver_path, slot=0):
+    """Yields a started Firefox session (attached to the --daemon browser if one is running)
+    and quits it on exit."""
+    with ExitStack() as stack:
+        profile = None if daemon_running() else stack.enter_context(profile_dir(slot))
+        driver = start_driver(geckodriver_path, profile)
+        try:
+            yield driver
+        finally:
+            logging.info("Quitting webdriver.")
+            driver.quit()
+
+def start_daemon(geckodriver_path):
+    """Launches a long-lived headless Firefox with Marionette enabled and records its PID.
+    Later runs attach to it instead of starting their own browser.
+    """
+    if daemon_running():
+        logging.info(f"Daemon Firefox already running (pid file {DAEMON_PID})")
+        return
+
+    firefox = shutil.which("firefox")
+    if not firefox:
+        sys.exit("firefox not found in PATH")
+
+    os.makedirs(DAEMON_PROFILE, exist_ok=True)
+    prefs = {**FIREFOX_PREFS, "marionette.port": MARIONETTE_PORT}
+    write_text(os.path.join(DAEMON_PROFILE, "user.js"),
+               "".join(f"user_pref({json.dumps(name)}, {json.dumps(value)});\n" for name, value in prefs.items()))
+    process = subprocess.Popen(
+        [firefox, "--headless", "--marionette", "--new-instance", "--profile", DAEMON_PROFILE],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True,
+    )
+    write_text(DAEMON_PID, str(process.pid))
+
+    # Wait for Marionette, then set the consent cookies once; they stay in the profile
+    for _ in range(50):
+        try:
+            socket.create_connection(("127.0.0.1", MARIONETTE_PORT), timeout=1).close()
+            break
+        except OSError:
+            time.sleep(0.2)
+    if not daemon_running():
+        sys.exit(f"daemon Firefox did not open marionette port {MARIONETTE_PORT}")
+    with firefox_session(geckodriver_path) as driver:
+        seed_consent_cookies(driver)
+    logging.info(f"Daemon Firefox started with pid {process.pid}")
+
+class DriverPool:
+    """Shares up to `size` Firefox sessions between worker threads.
+    Sessions are started (with the consent cookies set) on first demand, reused for the whole run,
+    and quit when the pool's `with` block exits.
+    """
+    def __init__(self, geckodriver_path, size):
+        self.geckodriver_path = geckodriver_path
+        self.slots = list(range(size)) # Profile slots not started yet
+        self.idle = queue.Queue()
+        self.sessions = ExitStack()
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return self.sessions.__exit__(*exc_info)
+
+    def _acquire(self):
+        while True:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                with self.lock:
+                    slot = self.slots.pop(0) if self.slots else None
+                driver = self.idle.get() if slot is None else self._start(slot)
+            if driver is not None:
+                return driver
+            # None is the wake-up left by a failed start: its slot is free again, so retry
+
+    def _start(self, slot):
+        try:
+            return self.sessions.enter_context(firefox_session(self.geckodriver_path, slot))
+        except Exception:
+            with self.lock:
+                self.slots.append(slot)
+            self.idle.put(None) # Wake a worker blocked in idle.get() so it doesn't wait forever
+            raise
+
+    @contextmanager
+    def driver(self):
+        driver = self._acquire()
+        try:
+            yield driver
+        finally:
+            self.idle.put(driver)
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='extract recent video info from youtube channels.')
     parser.add_argument('-v', '--verbose', action='store_true', help='enable detailed logging to output.log')
+    parser.add_argument('--daemon', action='store_true', help='start a persistent headless firefox that later runs attach to, then exit')
     args = parser.parse_args()
     setup_logging(args.verbose)
 
@@ -129,36 +586,38 @@ if __name__ == '__main__':
         "https://www.youtube.com/@linustechtips",
     )
 
-    options = Options()
-    options.add_argument("--headless")
-    driver = None
-    
-    service = None
-    geckodriver_path = get_geckodriver_path()
-    if geckodriver_path:
-        service = Service(executable_path=geckodriver_path)
+    if args.daemon:
+        start_daemon(get_geckodriver_path())
+        sys.exit()
 
+    channel_ids = load_channel_ids()
+    session = requests.Session()
+    # One pooled keep-alive connection per concurrent check
+    session.mount("https://", HTTPAdapter(pool_maxsize=HTTP_WORKERS))
+    for name, value in CONSENT_COOKIES.items():
+        session.cookies.set(name, value, domain=".youtube.com")
+    session.headers["Accept-Language"] = "en-US" # Relative dates are parsed in English
 
+    # Phase 1: the recency gate is plain HTTP, so every channel is checked at once
     try:
-        driver = webdriver.Firefox(options=options, service=service)
-        # Handle consent once at the beginning
+        with ThreadPoolExecutor(max_workers=min(len(youtubers_to_check), HTTP_WORKERS)) as executor:
+            recent = [info for info in executor.map(lambda url: check_recency(session, url, channel_ids), youtubers_to_check) if info]
+    finally:
+        save_channel_ids(channel_ids)
+        session.close()
+
+    # Phase 2: only recent uploads need the browser, for their descriptions. They are only
+    # logged, so skip geckodriver and Firefox entirely unless -v is on
+    if recent and logging.getLogger().isEnabledFor(logging.INFO):
         try:
-            driver.get("httpshttps://www.youtube.com")
-            # Using a more specific selector for the consent button
-            accept_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, '//button[.//span[contains(text(), "Accept all")]]'))
-            )
-            accept_button.click()
-            logging.info("Clicked the 'Accept all' consent button.")
-        except Exception:
-            logging.warning("Consent button not found or not clickable, continuing...")
+            geckodriver_path = get_geckodriver_path()
+            # Marionette allows a single session, so the daemon browser can't be pooled
+            workers = 1 if daemon_running() else min(len(recent), MAX_BROWSERS)
+            with DriverPool(geckodriver_path, workers) as pool, \
+                    ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda info: describe_video(pool, info), recent))
+        except Exception as e:
+            logging.warning(f"Could not fetch descriptions: {e}\n{traceback.format_exc()}")
 
-        for channel_url in youtubers_to_check:
-            video_info = get_recent_video_info(driver, channel_url)
-            if video_info:
-                youtuber, title, release_date, link = video_info
-                print(f"{youtuber} - {title}\n{release_date}\nLink: {link}")
-    finally:
-        if driver:
-            logging.info("Quitting webdriver.")
-            driver.quit()
\ No newline at end of file
+    for youtuber, title, release_date, link in recent:
+        print(f"{youtuber} - {title}\n{release_date}\nLink: {link}")